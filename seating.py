@@ -1,92 +1,361 @@
+import functools
+from dataclasses import dataclass
+import queue
+import re
 import sqlite3
-import random
+import sys
+import secrets
 import string
+import threading
 
 # --------------------------
 # Database Setup Functions
 # --------------------------
+# SQL statements used on every booking and cancellation. sqlite3 keeps compiled
+# statements in a per-connection cache keyed by their text, so reusing the same
+# string means each one is only prepared once.
+SQL_INSERT_BOOKING = '''
+    INSERT INTO bookings (booking_ref, passport_number, first_name, last_name, seat_row, seat_column, seat_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_DELETE_BOOKING = "DELETE FROM bookings WHERE booking_ref = ?"
+
+# Held by any thread writing through the shared connection, so writes are serialised;
+# reads do not take it.
+DB_LOCK = threading.Lock()
+
+# Database writes waiting for the background writer, as (operation, parameters) pairs,
+# where the operation is "insert" or "delete".
+WRITE_Q = queue.Queue()
+
+# SQL statement run by the background writer for each queued operation.
+WRITE_SQL = {
+    "insert": SQL_INSERT_BOOKING,
+    "delete": SQL_DELETE_BOOKING,
+}
+
+# Bookings whose database insert failed in the background writer:
+# seat identifier -> (booking reference, whether the reference is already used in the database, error).
+# Handled by undo_failed_bookings.
+FAILED_BOOKINGS = {}
+
+# Cancellations whose database delete failed in the background writer, as
+# (booking reference, error) pairs. Reported by undo_failed_bookings.
+FAILED_DELETES = []
+
 def init_db():
     """
     Initializes the SQLite database and creates the 'bookings' table if it does not exist.
     The table stores booking details: booking reference, passport number, first name, last name,
     seat row, seat column, and the complete seat identifier.
+    The database is switched to write-ahead logging with normal synchronisation, so that each
+    commit appends to the log instead of forcing a full sync of the database file.
+    The connection is opened in autocommit mode and may be used from any thread; writers
+    group their statements into explicit transactions while holding DB_LOCK.
+    Finally the background writer thread that applies queued writes is started.
     """
     global conn
-    conn = sqlite3.connect("bookings.db")  # Creates or opens the database file
+    # Creates or opens the database file. The connection is shared with the background writer thread.
+    conn = sqlite3.connect("bookings.db", check_same_thread=False, isolation_level=None)
     cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA wal_autocheckpoint=1000")  # Fold the log back into the database every 1000 pages
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # booking_ref is the PRIMARY KEY, so the database itself guarantees references are unique.
+    # The CHECK constraints only admit bookable seats: rows 1-80, columns A-F, a seat_id that
+    # matches its row and column, and none of the storage seats 77D-78F.
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS bookings (
             booking_ref TEXT PRIMARY KEY,
             passport_number TEXT,
             first_name TEXT,
             last_name TEXT,
-            seat_row INTEGER,
-            seat_column TEXT,
-            seat_id TEXT UNIQUE
+            seat_row INTEGER CHECK (seat_row BETWEEN 1 AND 80),
+            seat_column TEXT CHECK (seat_column IN ('A', 'B', 'C', 'D', 'E', 'F')),
+            seat_id TEXT UNIQUE,
+            CHECK (seat_id = seat_row || seat_column),
+            CHECK (NOT (seat_row IN (77, 78) AND seat_column IN ('D', 'E', 'F')))
         )
     ''')
-    conn.commit()
+    threading.Thread(target=_db_writer, daemon=True).start()
 
-def generate_booking_ref():
+def _db_writer():
     """
-    Generates a unique eight-character alphanumeric booking reference.
-    Uses random choices from uppercase letters and digits.
-    The function queries the database to ensure that the generated reference is unique,
-    generating a new one if a duplicate is found.
+    Background worker that applies the writes queued in WRITE_Q, in order.
+    A transaction is opened for the first pending write and committed once the queue is
+    empty, so a burst of bookings and cancellations shares one commit, and the user never
+    waits for it.
+    A write rejected by the database, or lost because its transaction could not be
+    committed, is passed to _write_failed exactly once. Every queued write is marked
+    done, so close_db never waits forever.
     """
     cursor = conn.cursor()
+    pending = []  # Writes applied in the open transaction but not yet committed
     while True:
-        booking_ref = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-        cursor.execute("SELECT COUNT(*) FROM bookings WHERE booking_ref = ?", (booking_ref,))
-        (count,) = cursor.fetchone()
-        if count == 0:
+        operation, params = WRITE_Q.get()
+        handled = False  # Whether the current write is in pending or already passed to _write_failed
+        try:
+            with DB_LOCK:
+                try:
+                    if not conn.in_transaction:
+                        cursor.execute("BEGIN")
+                    try:
+                        cursor.execute(WRITE_SQL[operation], params)
+                        pending.append((operation, params))
+                    except sqlite3.Error as error:
+                        _write_failed(operation, params, error)
+                    handled = True
+                    if WRITE_Q.empty():
+                        cursor.execute("COMMIT")
+                        pending.clear()
+                except sqlite3.Error as error:
+                    # BEGIN or COMMIT failed: nothing in the open transaction has been saved.
+                    try:
+                        conn.rollback()
+                    except sqlite3.Error:
+                        pass
+                    if not handled:
+                        # BEGIN failed, so the current write was never applied.
+                        _write_failed(operation, params, error)
+                    for lost_operation, lost_params in pending:
+                        _write_failed(lost_operation, lost_params, error)
+                    pending.clear()
+        finally:
+            WRITE_Q.task_done()
+
+def _write_failed(operation, params, error):
+    """
+    Handles a queued write that did not reach the database.
+    It runs on the background writer thread, so it only records the failure, in
+    FAILED_BOOKINGS or FAILED_DELETES; undo_failed_bookings reports it from the main thread.
+    """
+    if operation == "insert":
+        # The insert parameters start with the booking reference and end with the seat identifier.
+        ref_in_use = isinstance(error, sqlite3.IntegrityError) and "booking_ref" in str(error)
+        FAILED_BOOKINGS[params[-1]] = (params[0], ref_in_use, str(error))
+    else:
+        FAILED_DELETES.append((params[0], str(error)))
+
+def undo_failed_bookings():
+    """
+    Cancels the bookings whose database insert failed in the background writer.
+    The seat is set back to free (unless it has been freed or rebooked meanwhile),
+    the booking reference is released unless the database already uses it, and the
+    user is told that the booking was not saved.
+    Cancellations whose database delete failed cannot be undone in memory, so the user
+    is warned that the seat will show as booked again on the next start.
+    """
+    while FAILED_BOOKINGS:
+        seat_id, (booking_ref, ref_in_use, error) = FAILED_BOOKINGS.popitem()
+        booking = BOOKINGS.get(seat_id)
+        if booking is not None and booking.booking_ref == booking_ref:
+            del BOOKINGS[seat_id]
+            _set_status((booking.seat_row - 1) * SEATS_PER_ROW + booking.seat_col, FREE)
+        if not ref_in_use:
+            BOOKING_REFS.discard(booking_ref)
+        print(f"Error: The booking of seat {seat_id} (reference {booking_ref}) could not be saved "
+              f"({error}) and has been cancelled.")
+    while FAILED_DELETES:
+        booking_ref, error = FAILED_DELETES.pop(0)
+        print(f"Error: Booking {booking_ref} could not be removed from the database ({error}). "
+              f"The seat is free for now, but will show as booked again the next time the program starts.")
+
+def close_db():
+    """
+    Waits for the background writer to save every queued write, reports any write that
+    failed, then closes the database connection.
+    """
+    WRITE_Q.join()
+    undo_failed_bookings()
+    with DB_LOCK:
+        conn.close()
+
+# Alphabet used for booking references: uppercase letters and digits.
+BASE36 = (string.ascii_uppercase + string.digits).encode()
+
+# Translation table mapping a random byte onto the alphabet. Only bytes below 252 (7 * 36)
+# are used, so that every character is equally likely; the others are dropped.
+BOOKING_REF_TABLE = bytes(BASE36[value % 36] for value in range(256))
+REJECTED_BYTES = bytes(range(252, 256))
+
+def generate_booking_ref():
+    """
+    Generates an eight-character alphanumeric booking reference.
+    Random bytes from secrets.token_bytes are mapped onto uppercase letters and digits
+    with a translation table, dropping the few bytes that would bias the result.
+    A reference already in BOOKING_REFS is discarded and a new one drawn, so no database
+    lookup is needed; the returned reference is added to BOOKING_REFS.
+    """
+    while True:
+        chars = secrets.token_bytes(16).translate(BOOKING_REF_TABLE, REJECTED_BYTES)
+        if len(chars) < 8:
+            continue
+        booking_ref = chars[:8].decode()
+        if booking_ref not in BOOKING_REFS:
+            BOOKING_REFS.add(booking_ref)
             return booking_ref
 
 def load_existing_bookings():
     """
-    Loads booking records from the database and updates the in-memory seats dictionary.
+    Loads booking records from the database and updates the in-memory seat status store.
     This ensures that previously booked seats (stored in the database) are marked as booked
-    in the application's seating map when the program starts.
+    in the application's seating map when the program starts, that their booking details
+    are available in BOOKINGS, and that their booking references are known to
+    generate_booking_ref.
     """
     cursor = conn.cursor()
-    cursor.execute("SELECT seat_id, booking_ref FROM bookings")
-    booked_seats = cursor.fetchall()
-    for seat_id, booking_ref in booked_seats:
-        if seat_id in seats:
-            seats[seat_id] = booking_ref
+    booked_seats = cursor.execute(
+        "SELECT booking_ref, passport_number, first_name, last_name, seat_id FROM bookings"
+    ).fetchall()
+    BOOKING_REFS.update(booking[0] for booking in booked_seats)
+    # Tables created before the CHECK constraints were added may still hold records for
+    # invalid seat identifiers or storage seats. Those records are not loaded as bookings
+    # (their references stay in BOOKING_REFS, as the database still holds them).
+    BOOKINGS.update(
+        (seat_id, Booking(booking_ref, passport_number, first_name, last_name, *seat))
+        for booking_ref, passport_number, first_name, last_name, seat_id in booked_seats
+        if (seat := parse_seat_id(seat_id)) is not None
+        and STATUS[(seat[0] - 1) * SEATS_PER_ROW + seat[1]] != STORAGE
+    )
+    for booking in BOOKINGS.values():
+        _set_status((booking.seat_row - 1) * SEATS_PER_ROW + booking.seat_col, RESERVED)
 
 # --------------------------
 # Seating Layout Setup
 # --------------------------
 
 # Define seating layout for front and rear sections.
-front_rows = range(1, 81)           # Front section rows 1-80
-front_columns = ['A', 'B', 'C']      # Front section columns
+ROWS = 80                            # Rows 1-80
+COLUMNS = "ABCDEF"                   # Front section columns A-C, rear section columns D-F
+SEATS_PER_ROW = len(COLUMNS)
 
-rear_rows = range(1, 81)            # Rear section rows 1-80
-rear_columns = ['D', 'E', 'F']       # Rear section columns
+# Seat status codes as stored in STATUS.
+FREE = ord("F")
+RESERVED = ord("R")
+STORAGE = ord("S")
 
-# Create a dictionary to store the current status of each seat.
+# Contiguous store holding the current status of each seat, one byte per seat.
+# Seat <row><column> lives at index (row - 1) * 6 + column offset, so a whole
+# row (or block of rows) is a single slice.
 # For free seats, the value is "F".
 # For storage areas, the value is "S".
-# For booked seats, the value will be the unique booking reference.
-seats = {}
-
-# Initialize front section seats as free.
-for row in front_rows:
-    for col in front_columns:
-        seat_id = str(row) + col
-        seats[seat_id] = "F"
-
-# Initialize rear section seats.
-# Note: Rows 77 and 78 in the rear section are designated as storage ("S").
-for row in rear_rows:
-    for col in rear_columns:
-        seat_id = str(row) + col
-        if row in [77, 78]:
-            seats[seat_id] = "S"
+# For booked seats, the value is "R" and the booking details are kept in BOOKINGS.
+STATUS = bytearray(b"F" * (ROWS * SEATS_PER_ROW))
+
+# Note: Rows 77 and 78 in the rear section (columns D-F) are designated as storage ("S").
+STATUS[(77 - 1) * SEATS_PER_ROW + 3:77 * SEATS_PER_ROW] = b"SSS"
+STATUS[(78 - 1) * SEATS_PER_ROW + 3:78 * SEATS_PER_ROW] = b"SSS"
+
+# Booked seats of each row as a bit mask, ROW_MASK[row - 1] bit <column offset>
+# (bits 0-2 for columns A-C, bits 3-5 for columns D-F). Kept in step with STATUS by _set_status.
+ROW_MASK = bytearray(ROWS)
+
+# Pre-built seat identifiers, SEAT_IDS[row - 1][column offset] (e.g., SEAT_IDS[22][1] == "23B"),
+# so the seating display does not rebuild them on every refresh.
+SEAT_IDS = [[f"{row}{col}" for col in COLUMNS] for row in range(1, ROWS + 1)]
+
+# Identifiers of all free seats, kept in step with STATUS by _set_status, so the number
+# of free seats (or any free seat) is available without scanning STATUS.
+FREE_SEATS = {
+    seat_id
+    for row, row_ids in enumerate(SEAT_IDS)
+    for col, seat_id in enumerate(row_ids)
+    if STATUS[row * SEATS_PER_ROW + col] == FREE
+}
+
+@dataclass(slots=True, frozen=True)
+class Booking:
+    """
+    Details of one booked seat, as stored in the 'bookings' table.
+    seat_col is the column offset (0 for column A, 5 for column F).
+    """
+    booking_ref: str
+    passport_number: str
+    first_name: str
+    last_name: str
+    seat_row: int
+    seat_col: int
+
+# Booking details of the booked seats, keyed by seat identifier.
+# Only booked seats have an entry, so this stays small.
+BOOKINGS = {}
+
+# Every booking reference currently held in the database or queued for it, so a new
+# reference can be checked for uniqueness without querying the database.
+BOOKING_REFS = set()
+
+# Seat identifier in the format <row><column>: a row number without leading zeros and a column letter A-F.
+SEAT_ID_PATTERN = re.compile(r"([1-9][0-9]?)([A-F])")
+
+@functools.lru_cache(maxsize=512)
+def parse_seat_id(seat_id):
+    """
+    Parses a seat identifier in the format <row><column> (e.g., "23B").
+    Returns a (row, column offset) tuple such as (23, 1), or None if the seat identifier
+    does not name a seat on the aircraft. The seat's index in STATUS is
+    (row - 1) * SEATS_PER_ROW + column offset.
+    Results are cached: the 480 seats fit in the cache, so each identifier (and each
+    repeated invalid entry) is only parsed once.
+    """
+    match = SEAT_ID_PATTERN.fullmatch(seat_id)
+    if match is None:
+        return None
+    row = int(match.group(1))
+    if row > ROWS:
+        return None
+    return row, ord(match.group(2)) - ord("A")
+
+def _set_status(index, status):
+    """
+    Stores the status of the seat at the given index in STATUS and updates the
+    row's bit in ROW_MASK and the FREE_SEATS set to match.
+    """
+    STATUS[index] = status
+    row, col = divmod(index, SEATS_PER_ROW)
+    if status == RESERVED:
+        ROW_MASK[row] |= 1 << col
+        FREE_SEATS.discard(SEAT_IDS[row][col])
+    else:
+        ROW_MASK[row] &= ~(1 << col)
+        FREE_SEATS.add(SEAT_IDS[row][col])
+
+@functools.lru_cache(maxsize=None)
+def _render_section_row(row, first_col, mask, refs):
+    """
+    Builds the display line for the three seats of a row that start at column offset
+    first_col (0 for the front section, 3 for the rear section), e.g. "1A(F)  1B(F)  1C(F)".
+    mask holds the booked bits of those three seats and refs their booking references in
+    column order. Seats that are not booked are "F" or "S", and a seat never changes between
+    those two, so (row, first_col, mask, refs) fully determines the line and it is rebuilt
+    only after one of its seats is booked or freed.
+    """
+    seat_ids = SEAT_IDS[row - 1]
+    start = (row - 1) * SEATS_PER_ROW + first_col
+    refs = iter(refs)
+    labels = []
+    for offset in range(3):
+        if mask >> offset & 1:
+            status = next(refs)
         else:
-            seats[seat_id] = "F"
+            status = chr(STATUS[start + offset])
+        labels.append(f"{seat_ids[first_col + offset]}({status})")
+    return "  ".join(labels)
+
+def _section_rows(start_row, end_row, first_col):
+    """
+    Returns the display lines for rows start_row to end_row of one section, whose three seats
+    start at column offset first_col (0 for the front section, 3 for the rear section).
+    """
+    # Bind the module-level tables to local names once, rather than looking them up on every row.
+    row_mask, seat_ids, bookings, render = ROW_MASK, SEAT_IDS, BOOKINGS, _render_section_row
+    lines = []
+    for row in range(start_row, end_row + 1):
+        mask = row_mask[row - 1] >> first_col & 0b111
+        row_ids = seat_ids[row - 1]
+        refs = tuple(bookings[row_ids[first_col + offset]].booking_ref for offset in range(3) if mask >> offset & 1)
+        lines.append(render(row, first_col, mask, refs))
+    return lines
 
 # --------------------------
 # Application Functionalities
@@ -95,18 +364,23 @@ def check_availability():
     """
     Checks if a specified seat is available for booking.
     Prompts the user to input a seat number and then displays whether the seat is free,
-    already booked (shows the booking reference), or not bookable (storage area).
+    already booked (shows the booking reference and traveller name), or not bookable (storage area).
     """
-    seat_id = input("Enter the seat number (e.g., 1A, 3D): ").upper()
-    if seat_id in seats:
-        status = seats[seat_id]
-        if status == "F":
+    seat_id = input("Enter the seat number (e.g., 1A, 3D): ").strip().upper()
+    seat = parse_seat_id(seat_id)
+    if seat is not None:
+        seat_row, seat_col = seat
+        index = (seat_row - 1) * SEATS_PER_ROW + seat_col
+        status = STATUS[index]
+        if status == FREE:
             print(f"Seat {seat_id} is free and available for booking.")
-        elif status == "S":
+        elif status == STORAGE:
             print(f"Seat {seat_id} is a storage area and cannot be booked.")
         else:
-            # If the seat status is not F or S, it stores a booking reference.
-            print(f"Seat {seat_id} is booked with reference {status}.")
+            # A reserved seat has its booking details stored in BOOKINGS.
+            booking = BOOKINGS[seat_id]
+            print(f"Seat {seat_id} is booked with reference {booking.booking_ref} "
+                  f"for {booking.first_name} {booking.last_name}.")
     else:
         print("Invalid seat number. Please try again.")
 
@@ -114,54 +388,40 @@ def book_seat():
     """
     Books a specified seat if it is free.
     In addition to booking the seat, the function:
-      - Generates a unique booking reference.
       - Prompts the user for traveller details (passport number, first name, last name).
-      - Updates the seat status in the 'seats' dictionary to the booking reference.
-      - Inserts a new record with booking details into the SQLite database.
+      - Generates a unique booking reference.
+      - Marks the seat as reserved in STATUS and records its booking details in BOOKINGS.
+      - Queues a new record with booking details for insertion into the SQLite database.
     """
-    seat_id = input("Enter the seat number to book (e.g., 1A, 3D): ").upper()
-    if seat_id in seats:
-        status = seats[seat_id]
-        if status == "F":  # Only free seats can be booked
-            # Generate a unique 8-character booking reference.
-            booking_ref = generate_booking_ref()
-            
+    seat_id = input("Enter the seat number to book (e.g., 1A, 3D): ").strip().upper()
+    seat = parse_seat_id(seat_id)
+    if seat is not None:
+        seat_row, seat_col = seat
+        index = (seat_row - 1) * SEATS_PER_ROW + seat_col
+        status = STATUS[index]
+        if status == FREE:  # Only free seats can be booked
             # Prompt for traveller details.
             passport_number = input("Enter passport number: ").strip()
             first_name = input("Enter first name: ").strip()
             last_name = input("Enter last name: ").strip()
             
-            # Determine the seat's row and column based on the seat_id.
-            # Assumes the seat_id is in the format <row><column>, e.g., "23B".
-            row_part = seat_id[:-1]
-            col_part = seat_id[-1]
-            try:
-                seat_row = int(row_part)
-            except ValueError:
-                print("Invalid seat row.")
-                return
-
-            # Update the seat dictionary with the booking reference.
-            seats[seat_id] = booking_ref
+            # Generate a unique 8-character booking reference.
+            booking_ref = generate_booking_ref()
+            
+            # Mark the seat as reserved and remember its booking details.
+            BOOKINGS[seat_id] = Booking(booking_ref, passport_number, first_name, last_name, seat_row, seat_col)
+            _set_status(index, RESERVED)
             
-            # Insert the booking details into the database.
-            cursor = conn.cursor()
-            try:
-                cursor.execute('''
-                    INSERT INTO bookings (booking_ref, passport_number, first_name, last_name, seat_row, seat_column, seat_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (booking_ref, passport_number, first_name, last_name, seat_row, col_part, seat_id))
-                conn.commit()
-                print(f"Seat {seat_id} has been successfully booked.")
-                print(f"Your booking reference is: {booking_ref}")
-            except sqlite3.IntegrityError:
-                # In case the booking record already exists, revert the seat status.
-                seats[seat_id] = "F"
-                print("Error: This seat has already been booked.")
-        elif status == "S":
+            # Queue the booking details for the background writer. Should the database still reject
+            # the record (the PRIMARY KEY and seat_id UNIQUE constraints remain as a safety net),
+            # undo_failed_bookings cancels the booking.
+            WRITE_Q.put(("insert", (booking_ref, passport_number, first_name, last_name, seat_row, COLUMNS[seat_col], seat_id)))
+            print(f"Seat {seat_id} has been successfully booked.")
+            print(f"Your booking reference is: {booking_ref}")
+        elif status == STORAGE:
             print(f"Seat {seat_id} is a storage area and cannot be booked.")
         else:
-            print(f"Seat {seat_id} is already booked with reference {status}.")
+            print(f"Seat {seat_id} is already booked with reference {BOOKINGS[seat_id].booking_ref}.")
     else:
         print("Invalid seat number. Please try again.")
 
@@ -172,27 +432,40 @@ def free_seat():
     the function sets the seat status back to free ("F") and removes any
     corresponding booking record from the database.
     """
-    seat_id = input("Enter the seat number to free (e.g., 1A, 3D): ").upper()
-    if seat_id in seats:
-        status = seats[seat_id]
+    seat_id = input("Enter the seat number to free (e.g., 1A, 3D): ").strip().upper()
+    seat = parse_seat_id(seat_id)
+    if seat is not None:
+        seat_row, seat_col = seat
+        index = (seat_row - 1) * SEATS_PER_ROW + seat_col
+        status = STATUS[index]
         # Only booked seats (neither free "F" nor storage "S") can be freed.
-        if status != "F" and status != "S":
-            booking_ref = status  # The current value is the booking reference.
-            # Remove the booking record from the database.
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM bookings WHERE booking_ref = ?", (booking_ref,))
-            conn.commit()
+        if status == RESERVED:
+            booking_ref = BOOKINGS.pop(seat_id).booking_ref
+            # Queue the removal of the booking record from the database.
+            WRITE_Q.put(("delete", (booking_ref,)))
+            BOOKING_REFS.discard(booking_ref)
             
             # Update seat status to free.
-            seats[seat_id] = "F"
+            _set_status(index, FREE)
             print(f"Seat {seat_id} has been freed and is now available.")
-        elif status == "F":
+        elif status == FREE:
             print(f"Seat {seat_id} is already free.")
         else:
             print(f"Seat {seat_id} is a storage area and cannot be freed.")
     else:
         print("Invalid seat number. Please try again.")
 
+# Row range (first row, last row) displayed for each row selection menu choice:
+# '1' -> (1, 10), '2' -> (11, 20), ..., '8' -> (71, 80).
+ROW_RANGES = {str(choice): (choice * 10 - 9, choice * 10) for choice in range(1, 9)}
+
+# Row selection menu shown by show_booking_status, built from ROW_RANGES so the two always agree.
+ROW_MENU_TEXT = (
+    "\nSelect rows to display (10 rows at a time):\n"
+    + "".join(f"{choice}. Rows {first}-{last}\n" for choice, (first, last) in ROW_RANGES.items())
+    + "9. Return to main menu\n"
+)
+
 def show_booking_status():
     """
     Displays the current booking status for the aircraft seating.
@@ -200,55 +473,52 @@ def show_booking_status():
     with an aisle separator. Booked seats will display the booking reference instead of 'R'.
     """
     while True:
-        print("\nSelect rows to display (10 rows at a time):")
-        print("1. Rows 1-10")
-        print("2. Rows 11-20")
-        print("3. Rows 21-30")
-        print("4. Rows 31-40")
-        print("5. Rows 41-50")
-        print("6. Rows 51-60")
-        print("7. Rows 61-70")
-        print("8. Rows 71-80")
-        print("9. Return to main menu")
+        sys.stdout.write(ROW_MENU_TEXT)
         
         choice = input("Enter your choice (1-9): ")
         if choice == '9':
             return
         
-        try:
-            choice = int(choice)
-            if 1 <= choice <= 8:
-                start_row = (choice - 1) * 10 + 1
-                end_row = start_row + 9
-                
-                print(f"\n--- Booking Status (Rows {start_row}-{end_row}) ---")
-                
-                # Display Front Section (Rows start_row to end_row, Columns A-C)
-                print(f"\nFront Section (Rows {start_row}-{end_row}, Columns A-C):")
-                for row in range(start_row, end_row + 1):
-                    row_display = ""
-                    for col in front_columns:
-                        seat_id = str(row) + col
-                        row_display += f"{seat_id}({seats[seat_id]})  "
-                    print(row_display)
-                
-                # Display aisle separator
-                print("\nAisle:")
-                print("X   X   X")
-                
-                # Display Rear Section (Rows start_row to end_row, Columns D-F)
-                print(f"\nRear Section (Rows {start_row}-{end_row}, Columns D-F):")
-                for row in range(start_row, end_row + 1):
-                    row_display = ""
-                    for col in rear_columns:
-                        seat_id = str(row) + col
-                        row_display += f"{seat_id}({seats[seat_id]})  "
-                    print(row_display)
-                print()  # Blank line for improved readability
-            else:
-                print("Invalid choice. Please select a number between 1 and 9.")
-        except ValueError:
-            print("Invalid input. Please enter a number between 1 and 9.")
+        row_range = ROW_RANGES.get(choice)
+        if row_range:
+            start_row, end_row = row_range
+            
+            # Collect the whole view and write it out in one go.
+            parts = ["", f"--- Booking Status (Rows {start_row}-{end_row}) ---"]
+            
+            # Display Front Section (Rows start_row to end_row, Columns A-C)
+            parts += ["", f"Front Section (Rows {start_row}-{end_row}, Columns A-C):"]
+            parts += _section_rows(start_row, end_row, 0)
+            
+            # Display aisle separator
+            parts += ["", "Aisle:", "X   X   X"]
+            
+            # Display Rear Section (Rows start_row to end_row, Columns D-F)
+            parts += ["", f"Rear Section (Rows {start_row}-{end_row}, Columns D-F):"]
+            parts += _section_rows(start_row, end_row, 3)
+            parts.append("")  # Blank line for improved readability
+            sys.stdout.write("\n".join(parts))
+            sys.stdout.write("\n")
+        else:
+            print("Invalid choice. Please select a number between 1 and 9.")
+
+# Main menu text, written in one go on every pass of the main menu loop.
+MAIN_MENU_TEXT = (
+    "===== Apache Airlines Seat-Booking System =====\n"
+    "1. Check availability of seat\n"
+    "2. Book a seat\n"
+    "3. Free a seat\n"
+    "4. Show booking status\n"
+    "5. Exit program\n"
+)
+
+# Action run for each main menu choice (choice '5' exits and is handled by main_menu).
+MAIN_MENU_ACTIONS = {
+    '1': check_availability,
+    '2': book_seat,
+    '3': free_seat,
+    '4': show_booking_status,
+}
 
 def main_menu():
     """
@@ -256,22 +526,14 @@ def main_menu():
     The menu remains until the user chooses to exit the program.
     """
     while True:
-        print("===== Apache Airlines Seat-Booking System =====")
-        print("1. Check availability of seat")
-        print("2. Book a seat")
-        print("3. Free a seat")
-        print("4. Show booking status")
-        print("5. Exit program")
+        # Report any write the background writer could not save (cancelling failed bookings).
+        undo_failed_bookings()
+        sys.stdout.write(MAIN_MENU_TEXT)
         choice = input("Enter your choice (1-5): ")
         
-        if choice == '1':
-            check_availability()
-        elif choice == '2':
-            book_seat()
-        elif choice == '3':
-            free_seat()
-        elif choice == '4':
-            show_booking_status()
+        action = MAIN_MENU_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == '5':
             print("Exiting the program. Goodbye!")
             break
@@ -285,9 +547,12 @@ def main_menu():
 if __name__ == "__main__":
     # Initialize database connection and create bookings table.
     init_db()
-    # Load any existing bookings from the database into the in-memory seats dictionary.
+    # Load any existing bookings from the database into the in-memory seat status store.
     load_existing_bookings()
-    # Start the main application loop.
-    main_menu()
-    # Close the database connection when the program exits.
-    conn.close()
+    try:
+        # Start the main application loop.
+        main_menu()
+    finally:
+        # Save any queued writes and close the database connection when the program exits,
+        # including when it is interrupted (Ctrl-C or end of input).
+        close_db()